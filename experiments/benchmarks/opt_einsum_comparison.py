@@ -0,0 +1,95 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Times TensorNetwork contraction against a direct `opt_einsum` call.
+
+The network is four rank-3 tensors contracted to a scalar
+(`bca,cdg,dbf,afg->` in einsum notation), swept over bond dimension.
+"""
+
+import os
+# Pin BLAS to one thread per process so the worker pool below doesn't
+# oversubscribe the machine; must be set before numpy is imported.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import opt_einsum
+import tensornetwork
+
+EXPRESSION = "bca,cdg,dbf,afg->"
+D_LIST = [10, 20, 40, 60, 80, 100]
+# Single precision halves memory traffic in the GEMM kernels; switch back to
+# np.float64 to benchmark at full precision.
+DTYPE = np.float32
+
+
+def build_network(d):
+  """Returns the network and its four nodes for bond dimension `d`."""
+  net = tensornetwork.TensorNetwork(backend="numpy")
+  a = net.add_node(np.random.randn(d, d, d).astype(DTYPE))
+  b = net.add_node(np.random.randn(d, d, d).astype(DTYPE))
+  c = net.add_node(np.random.randn(d, d, d).astype(DTYPE))
+  d_node = net.add_node(np.random.randn(d, d, d).astype(DTYPE))
+  # bca,cdg,dbf,afg
+  a[0] ^ c[1]  # b
+  a[1] ^ b[0]  # c
+  a[2] ^ d_node[0]  # a
+  b[1] ^ c[0]  # d
+  b[2] ^ d_node[2]  # g
+  c[2] ^ d_node[1]  # f
+  return net, [a, b, c, d_node]
+
+
+def run_for_d(d, path):
+  """Times one TensorNetwork and one `opt_einsum` contraction at `d`."""
+  net, nodes = build_network(d)
+  tensors = [node.tensor for node in nodes]
+
+  start = time.time()
+  result = tensornetwork.contractors.optimal(net)
+  tn_time = time.time() - start
+  # Printing materializes the tensor on the host; keep it out of the
+  # timed region.
+  print(result.get_final_node().tensor)
+
+  start = time.time()
+  oe_result = opt_einsum.contract(EXPRESSION, *tensors, optimize=path)
+  oe_time = time.time() - start
+  print(oe_result)
+  return tn_time, oe_time
+
+
+def main():
+  # The topology is fixed across the sweep, so the optimal path only has
+  # to be found once; reusing it keeps the timings pure compute time.
+  dummies = [np.ones((2, 2, 2))] * 4
+  path, _ = opt_einsum.contract_path(EXPRESSION, *dummies, optimize="optimal")
+
+  # The D values are independent, so sweep them in parallel, one process
+  # per D (BLAS is pinned to a single thread above).
+  with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+    results = list(executor.map(functools.partial(run_for_d, path=path),
+                                D_LIST))
+  tn_times = [tn_time for tn_time, _ in results]
+  oe_times = [oe_time for _, oe_time in results]
+
+  print("D:", D_LIST)
+  print("TensorNetwork:", tn_times)
+  print("opt_einsum:", oe_times)
+
+
+if __name__ == "__main__":
+  main()
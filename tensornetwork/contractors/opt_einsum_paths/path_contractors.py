@@ -13,17 +13,25 @@
 # limitations under the License.
 """Contractors based on `opt_einsum`'s path algorithms."""
 
+import contextlib
 import functools
 import opt_einsum
 from tensornetwork import network
 from tensornetwork import network_components
 from tensornetwork.contractors.opt_einsum_paths import utils
-from typing import Any, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence
+
+# Backends whose tensors `opt_einsum.contract` can dispatch on directly.
+# Other backends (e.g. `shell`) only work through `net.backend`'s own
+# einsum/tensordot implementations, and even for dispatchable backends
+# the fused call bypasses backend-specific contraction kernels, so the
+# pairwise loop remains the route for everything not listed here.
+_FUSED_ROUTE_BACKENDS = frozenset({"numpy", "tensorflow", "jax", "pytorch"})
 
 
 def base(net: network.TensorNetwork, algorithm: utils.Algorithm,
-         output_edge_order: Optional[Sequence[network_components.Edge]] = None
-         ) -> network.TensorNetwork:
+         output_edge_order: Optional[Sequence[network_components.Edge]] = None,
+         cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Base method for all `opt_einsum` contractors.
 
   Args:
@@ -34,6 +42,10 @@ def base(net: network.TensorNetwork, algorithm: utils.Algorithm,
       are reordered into `output_edge_order`;
       if final node has more than one edge,
       `output_edge_order` must be provided.
+    cache: An optional dictionary passed to
+      `opt_einsum.shared_intermediates`. Subcontractions repeated across
+      calls that share the same cache are computed only once, trading
+      memory for compute.
 
   Returns:
     The network after full contraction.
@@ -44,16 +56,71 @@ def base(net: network.TensorNetwork, algorithm: utils.Algorithm,
   for edge in edges:
     if edge in net and edge.is_trace():
       net.contract_parallel(edge)
+  # Copy nodes connected to a single node only mark a diagonal of that
+  # node; consume them up front so the copy tensor is never materialized.
+  edge_map, copy_neighbors = utils.find_copy_nodes(net)
+  contracted_copies = False
+  for copy, neighbors in copy_neighbors.items():
+    # An earlier iteration may have consumed this copy or its neighbor;
+    # check against the live network, not the snapshot in the map.
+    if copy not in net.nodes_set:
+      continue
+    # Only consume copies whose edges all map to a representative: ones
+    # with dangling, trace or copy-copy edges are left to the pairwise
+    # fallback, which bridges or materializes them.
+    if (len(neighbors) == 1 and
+        all(edge in edge_map for edge in copy.edges)):
+      utils.contract_between_copy(net, copy)
+      contracted_copies = True
+  if contracted_copies:
+    edge_map, copy_neighbors = utils.find_copy_nodes(net)
+
   if not net.get_all_nondangling():
     # There's nothing to contract.
     return net
 
-  # Then apply `opt_einsum`'s algorithm
-  path, nodes = utils.get_path(net, algorithm)
-  for a, b in path:
-    new_node = nodes[a] @ nodes[b]
-    nodes.append(new_node)
-    nodes = utils.multi_remove(nodes, [a, b])
+  # Then apply `opt_einsum`'s algorithm. Copy nodes are not passed to the
+  # path search; their neighbors appear directly connected through shared
+  # representative edges and the copy tensors are consumed during the
+  # pairwise contractions. The copy map is patched incrementally instead
+  # of rescanning the network on every step.
+  path, nodes = utils.get_path(net, algorithm, edge_map)
+  sharing = (opt_einsum.shared_intermediates(cache)
+             if cache is not None else contextlib.suppress())
+  # When every copy node is fully consumed by the contraction and the
+  # backend's tensors are dispatchable by `opt_einsum`, the whole network
+  # collapses in one fused `opt_einsum` call along the precomputed path;
+  # otherwise fall back to one backend call per contraction step.
+  if (net.backend.name in _FUSED_ROUTE_BACKENDS and
+      all(edge in edge_map for copy in copy_neighbors for edge in copy.edges)):
+    with sharing:
+      utils.contract_network(net, path, nodes, edge_map, list(copy_neighbors))
+  else:
+    with sharing:
+      for a, b in path:
+        node1, node2 = nodes[a], nodes[b]
+        shared_copies = {
+            copy for copy, neighbors in copy_neighbors.items()
+            if node1 in neighbors and node2 in neighbors
+        }
+        if shared_copies:
+          new_node = utils.contract_between_with_copies(net, node1, node2,
+                                                        shared_copies)
+        else:
+          # Path finders may legitimately pair nodes sharing no edge,
+          # especially with copy nodes excluded from the search.
+          new_node = net.contract_between(node1, node2,
+                                          allow_outer_product=True)
+        if copy_neighbors:
+          utils.update_copy_map(net, copy_neighbors, (node1, node2), new_node)
+        nodes.append(new_node)
+        nodes = utils.multi_remove(nodes, [a, b])
+      # Copy nodes that could not be consumed by the pairwise steps (e.g.
+      # ones with dangling edges) remain; contract them with their
+      # materialized tensors.
+      for edge in net.get_all_nondangling():
+        if edge in net:
+          net.contract_parallel(edge)
 
   # if the final node has more than one edge,
   # output_edge_order has to be specified
@@ -75,13 +142,16 @@ def base(net: network.TensorNetwork, algorithm: utils.Algorithm,
 
 def optimal(net: network.TensorNetwork,
             output_edge_order: Sequence[network_components.Edge] = None,
-            memory_limit: Optional[int] = None) -> network.TensorNetwork:
+            memory_limit: Optional[int] = None,
+            cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Optimal contraction order via `opt_einsum`.
 
-  This method will find the truly optimal contraction order via
-  `opt_einsum`'s depth first search algorithm. Since this search is
-  exhaustive, if your network is large (n>10), then the search may
-  take longer than just contracting in a suboptimal way.
+  This method will find the truly optimal contraction order. For small
+  networks the exhaustive depth first search of `opt_einsum` is used; for
+  anything larger the search is routed through `opt_einsum`'s dynamic
+  programming algorithm, which finds a guaranteed optimal path far
+  faster in practice, though the search remains exponential in the worst
+  case (hence the node cap in `auto`).
 
   Args:
     net: a TensorNetwork object.
@@ -91,18 +161,21 @@ def optimal(net: network.TensorNetwork,
       if final node has more than one edge,
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
+    cache: An optional `opt_einsum.shared_intermediates` dictionary; see
+      `base`.
 
   Returns:
     The network after full contraction.
   """
-  alg = functools.partial(opt_einsum.paths.optimal, memory_limit=memory_limit)
-  return base(net, alg, output_edge_order)
+  alg = functools.partial(utils.optimal_path, memory_limit=memory_limit)
+  return base(net, alg, output_edge_order, cache)
 
 
 def branch(net: network.TensorNetwork,
            output_edge_order: Sequence[network_components.Edge] = None,
            memory_limit: Optional[int] = None,
-           nbranch: Optional[int] = None) -> network.TensorNetwork:
+           nbranch: Optional[int] = None,
+           cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Branch contraction path via `opt_einsum`.
 
   This method uses the DFS approach of `optimal` while sorting potential
@@ -122,18 +195,21 @@ def branch(net: network.TensorNetwork,
     nbranch: Number of best contractions to explore.
       If None it explores all inner products starting with those that
       have the best cost heuristic.
+    cache: An optional `opt_einsum.shared_intermediates` dictionary; see
+      `base`.
 
   Returns:
     The network after full contraction.
   """
   alg = functools.partial(opt_einsum.paths.branch,
                           memory_limit=memory_limit, nbranch=nbranch)
-  return base(net, alg, output_edge_order)
+  return base(net, alg, output_edge_order, cache)
 
 
 def greedy(net: network.TensorNetwork,
            output_edge_order: Sequence[network_components.Edge] = None,
-           memory_limit: Optional[int] = None) -> network.TensorNetwork:
+           memory_limit: Optional[int] = None,
+           cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Greedy contraction path via `opt_einsum`.
 
   This provides a more efficient strategy than `optimal` for finding
@@ -151,20 +227,24 @@ def greedy(net: network.TensorNetwork,
       if final node has more than one edge,
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
+    cache: An optional `opt_einsum.shared_intermediates` dictionary; see
+      `base`.
 
   Returns:
     The network after full contraction.
   """
   alg = functools.partial(opt_einsum.paths.greedy, memory_limit=memory_limit)
-  return base(net, alg, output_edge_order)
+  return base(net, alg, output_edge_order, cache)
 
 
 def auto(net: network.TensorNetwork,
          output_edge_order: Sequence[network_components.Edge] = None,
-         memory_limit: Optional[int] = None) -> network.TensorNetwork:
+         memory_limit: Optional[int] = None,
+         cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Chooses one of the above algorithms according to network size.
 
-  Default behavior is based on `opt_einsum`'s `auto` contractor.
+  Networks of up to 16 nodes are contracted along a guaranteed optimal
+  path (see `optimal`); beyond that the greedy heuristic is used.
 
   Args:
     net: a TensorNetwork object.
@@ -174,6 +254,8 @@ def auto(net: network.TensorNetwork,
       if final node has more than one edge,
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
+    cache: An optional `opt_einsum.shared_intermediates` dictionary; see
+      `base`.
 
   Returns:
     The network after full contraction.
@@ -194,21 +276,18 @@ def auto(net: network.TensorNetwork,
 
     final_node.reorder_edges(output_edge_order)
     return net
-  if n < 5:
-    return optimal(net, output_edge_order, memory_limit)
-  if n < 7:
-    return branch(net, output_edge_order, memory_limit)
-  if n < 9:
-    return branch(net, output_edge_order, memory_limit, nbranch=2)
-  if n < 15:
-    return branch(net, output_edge_order, nbranch=1)
-  return greedy(net, output_edge_order, memory_limit)
+  if n <= 16:
+    # `optimal` is brute force below 5 nodes and dynamic programming beyond,
+    # so it stays affordable throughout this range.
+    return optimal(net, output_edge_order, memory_limit, cache)
+  return greedy(net, output_edge_order, memory_limit, cache)
 
 
 def custom(net: network.TensorNetwork,
            optimizer: Any,
            output_edge_order: Sequence[network_components.Edge] = None,
-           memory_limit: Optional[int] = None) -> network.TensorNetwork:
+           memory_limit: Optional[int] = None,
+           cache: Optional[Dict] = None) -> network.TensorNetwork:
   """Uses a custom path optimizer created by the user to calculate paths.
 
   The custom path optimizer should inherit `opt_einsum`'s `PathOptimizer`.
@@ -224,9 +303,11 @@ def custom(net: network.TensorNetwork,
       output_edge_order` must be provided.
     optimizer: A custom `opt_einsum.PathOptimizer` object.
     memory_limit: Maximum number of elements in an array during contractions.
+    cache: An optional `opt_einsum.shared_intermediates` dictionary; see
+      `base`.
 
   Returns:
     The network after full contraction.
   """
   alg = functools.partial(optimizer, memory_limit=memory_limit)
-  return base(net, alg, output_edge_order)
\ No newline at end of file
+  return base(net, alg, output_edge_order, cache)
\ No newline at end of file
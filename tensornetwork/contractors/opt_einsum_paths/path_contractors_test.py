@@ -16,17 +16,25 @@ import numpy as np
 import pytest
 import tensornetwork
 from tensornetwork.contractors.opt_einsum_paths import path_contractors
-import tensorflow as tf
-tf.enable_v2_behavior()
 
+# Only the tensorflow-backend runs need the v2-behavior bootstrap; guard
+# the import so collection and the other backend runs don't pay for it.
+try:
+  import tensorflow as tf
+  tf.enable_v2_behavior()
+except ImportError:
+  pass
 
-@pytest.fixture(name="path_algorithm",
-                params=["optimal", "branch", "greedy", "auto"])
+
+ALGORITHM_NAMES = ["optimal", "branch", "greedy", "auto"]
+
+
+@pytest.fixture(name="path_algorithm", params=ALGORITHM_NAMES)
 def path_algorithm_fixture(request):
   return getattr(path_contractors, request.param)
 
 
-def test_sanity_check(backend, path_algorithm):
+def sanity_network(backend):
   net = tensornetwork.TensorNetwork(backend=backend)
   a = net.add_node(np.eye(2))
   b = net.add_node(np.ones((2, 7, 11)))
@@ -38,11 +46,10 @@ def test_sanity_check(backend, path_algorithm):
   b[2] ^ c[1]
   c[2] ^ d[1]
   c[3] ^ a[1]
-  final_node = path_algorithm(net).get_final_node()
-  assert final_node.shape == (13,)
+  return net
 
 
-def test_trace_edge(backend, path_algorithm):
+def trace_edge_network(backend):
   net = tensornetwork.TensorNetwork(backend=backend)
   a = net.add_node(np.ones((2, 2, 2, 2, 2)))
   b = net.add_node(np.ones((2, 2, 2)))
@@ -53,10 +60,82 @@ def test_trace_edge(backend, path_algorithm):
   a[3] ^ c[0]
   b[1] ^ c[1]
   b[2] ^ c[2]
+  return net
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_path_cache():
+  """Solve each test topology once per algorithm up front.
+
+  The parametrized tests below then hit the memoized contraction paths
+  instead of re-running the same path search for every backend.
+  """
+  for build in [sanity_network, trace_edge_network]:
+    for name in ALGORITHM_NAMES:
+      getattr(path_contractors, name)(build("numpy"))
+
+
+def test_sanity_check(backend, path_algorithm):
+  net = sanity_network(backend)
+  final_node = path_algorithm(net).get_final_node()
+  assert final_node.shape == (13,)
+
+
+def test_trace_edge(backend, path_algorithm):
+  net = trace_edge_network(backend)
   node = path_algorithm(net).get_final_node()
   np.testing.assert_allclose(node.tensor, np.ones(2) * 32.0)
 
 
+def test_copy_node_fully_consumed(backend, path_algorithm):
+  # Every copy edge has a representative: the fused route applies.
+  net = tensornetwork.TensorNetwork(backend=backend)
+  a = net.add_node(np.ones((2, 2)))
+  b = net.add_node(np.ones((2, 2)))
+  c = net.add_node(np.ones((2, 2)))
+  cn = net.add_copy_node(rank=3, dimension=2)
+  # pylint: disable=pointless-statement
+  a[1] ^ cn[0]
+  b[0] ^ cn[1]
+  c[0] ^ cn[2]
+  net = path_algorithm(net, output_edge_order=[a[0], b[1], c[1]])
+  node = net.get_final_node()
+  np.testing.assert_allclose(node.tensor, 2 * np.ones((2, 2, 2)))
+
+
+def test_copy_node_dangling_edge(backend, path_algorithm):
+  # A dangling copy leg survives into the output; the pairwise fallback
+  # materializes the copy tensor at the end.
+  net = tensornetwork.TensorNetwork(backend=backend)
+  a = net.add_node(np.ones((2, 2)))
+  b = net.add_node(np.ones((2, 2)))
+  cn = net.add_copy_node(rank=3, dimension=2)
+  # pylint: disable=pointless-statement
+  a[1] ^ cn[0]
+  b[0] ^ cn[1]
+  net = path_algorithm(net, output_edge_order=[a[0], b[1], cn[2]])
+  node = net.get_final_node()
+  np.testing.assert_allclose(
+      node.tensor, np.einsum("ai,ib,iz->abz", np.ones((2, 2)),
+                             np.ones((2, 2)), np.eye(2)))
+
+
+def test_copy_copy_chain(backend, path_algorithm):
+  # Copies joined by a copy-copy edge act as one identity between a and b.
+  net = tensornetwork.TensorNetwork(backend=backend)
+  a = net.add_node(np.ones((2, 2)))
+  b = net.add_node(np.ones((2, 2)))
+  cn1 = net.add_copy_node(rank=2, dimension=2)
+  cn2 = net.add_copy_node(rank=2, dimension=2)
+  # pylint: disable=pointless-statement
+  a[0] ^ cn1[0]
+  cn1[1] ^ cn2[0]
+  cn2[1] ^ b[0]
+  net = path_algorithm(net, output_edge_order=[a[1], b[1]])
+  node = net.get_final_node()
+  np.testing.assert_allclose(node.tensor, 2 * np.ones((2, 2)))
+
+
 def test_disconnected_network(backend, path_algorithm):
   net = tensornetwork.TensorNetwork(backend=backend)
   a = net.add_node(np.array([2, 2]))
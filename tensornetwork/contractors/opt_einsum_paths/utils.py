@@ -13,21 +13,145 @@
 # limitations under the License.
 """Helper methods for `path_contractors`."""
 
+import collections
+import concurrent.futures
+import functools
+import itertools
+import threading
+
+import opt_einsum
 from tensornetwork import network
 from tensornetwork import network_components
-from typing import Any, Callable, Dict, List, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 # `opt_einsum` algorithm method typing
 Algorithm = Callable[[List[Set[int]], Set[int], Dict[int, int]],
                      List[Tuple[int, int]]]
 
+# Tuned for tensor network contractions: minimizing flops and skipping the
+# outer-product search is provably optimal when no index appears in more
+# than two inputs, and the optimizer also accepts the hyperedge inputs
+# produced by copy nodes.
+_dynamic_programming = opt_einsum.paths.DynamicProgramming(
+    minimize="flops", search_outer=False)
+
+
+def optimal_path(input_sets: List[Set[int]], output_set: Set[int],
+                 size_dict: Dict[int, int],
+                 memory_limit: Optional[int] = None
+                 ) -> List[Tuple[int, int]]:
+  """Guaranteed-optimal path: brute force for tiny networks, DP otherwise."""
+  if len(input_sets) <= 4:
+    return opt_einsum.paths.optimal(input_sets, output_set, size_dict,
+                                    memory_limit)
+  return _dynamic_programming(input_sets, output_set, size_dict, memory_limit)
+
+# Memoized contraction paths, keyed by a canonical form of the network
+# structure and the path algorithm. Repeated contractions of networks with
+# identical topology and edge dimensions (e.g. inside iterative algorithms)
+# then skip the path search entirely.
+_path_cache = collections.OrderedDict()  # type: collections.OrderedDict
+_PATH_CACHE_MAXSIZE = 1024
+# Lookups and evictions are multi-step OrderedDict mutations; the lock
+# keeps them atomic for concurrent callers (see `get_path_async`).
+_path_cache_lock = threading.Lock()
+
+
+def clear_path_cache() -> None:
+  """Clear all memoized contraction paths."""
+  with _path_cache_lock:
+    _path_cache.clear()
+
+
+def _algorithm_cache_key(algorithm: Algorithm) -> Optional[Tuple]:
+  """Build a hashable descriptor of a path algorithm.
+
+  Only `functools.partial` wrappers of module-level functions (as used by
+  `path_contractors`) can be described in a way that is stable across calls.
+  For any other callable `None` is returned and no caching is attempted.
+  """
+  if isinstance(algorithm, functools.partial):
+    qualname = getattr(algorithm.func, "__qualname__", None)
+    if qualname is None:  # e.g. a custom optimizer instance
+      return None
+    try:
+      return (algorithm.func.__module__, qualname,
+              algorithm.args, tuple(sorted(algorithm.keywords.items())))
+    except TypeError:  # unhashable arguments
+      return None
+  return None
+
+
+def _compress_colors(colors: List[Any]) -> List[int]:
+  """Map a list of comparable color values to their sorted ranks."""
+  ranks = {color: rank for rank, color in enumerate(sorted(set(colors)))}
+  return [ranks[color] for color in colors]
+
+
+def _canonical_node_order(node_edges: List[List[network_components.Edge]]
+                          ) -> Optional[List[int]]:
+  """Structure-determined node ordering via Weisfeiler-Lehman refinement.
+
+  Nodes are colored by their local structure (edge dimensions and
+  danglingness) and the colors are refined a few rounds through the
+  neighbor colors. If the refinement separates every node, the color
+  ranking is an ordering that depends only on the network structure, so
+  topologically identical networks built in different node orders produce
+  the same canonical form (and thus the same path cache key). Returns
+  `None` when some nodes remain indistinguishable.
+  """
+  # The refinement rounds revisit every edge several times; resolve the
+  # dimension (a weakref plus a backend shape call) once per edge here.
+  incidence = {}  # type: Dict[network_components.Edge, List[int]]
+  dims = {}  # type: Dict[network_components.Edge, int]
+  for i, edges in enumerate(node_edges):
+    for edge in edges:
+      incidence.setdefault(edge, []).append(i)
+      if edge not in dims:
+        dims[edge] = edge.dimension
+  colors = _compress_colors([
+      tuple(sorted((dims[edge], edge.is_dangling()) for edge in edges))
+      for edges in node_edges])
+  for _ in range(3):
+    if len(set(colors)) == len(colors):
+      break
+    signatures = []
+    for i, edges in enumerate(node_edges):
+      neighbor_colors = []
+      for edge in edges:
+        for j in incidence[edge]:
+          if j != i:
+            neighbor_colors.append((dims[edge], colors[j]))
+      signatures.append((colors[i], tuple(sorted(neighbor_colors))))
+    new_colors = _compress_colors(signatures)
+    if len(set(new_colors)) == len(set(colors)):
+      break  # The partition is stable; further rounds cannot refine it.
+    colors = new_colors
+  if len(set(colors)) != len(colors):
+    return None
+  return sorted(range(len(colors)), key=colors.__getitem__)
+
 
 def multi_remove(elems: List[Any], indices: List[int]) -> List[Any]:
   """Remove multiple indicies in a list at once."""
-  return [i for j, i in enumerate(elems) if j not in indices]
+  # A byte mask indexed by position is cheaper to probe than a hash set.
+  mask = bytearray(len(elems))
+  for index in indices:
+    mask[index] = 1
+  return [elem for j, elem in enumerate(elems) if not mask[j]]
+
 
+def _sets_size(indices: Set[int], size_dict: Dict[int, int]) -> int:
+  """Product of the dimensions of a set of indices."""
+  size = 1
+  for index in indices:
+    size *= size_dict[index]
+  return size
 
-def get_path(net: network.TensorNetwork, algorithm: Algorithm
+
+def get_path(net: network.TensorNetwork, algorithm: Algorithm,
+             edge_map: Optional[Dict[network_components.Edge,
+                                     network_components.Edge]] = None
              ) -> Tuple[List[Tuple[int, int]],
                         List[network_components.BaseNode]]:
   """Calculates the contraction paths using `opt_einsum` methods.
@@ -35,14 +159,667 @@ def get_path(net: network.TensorNetwork, algorithm: Algorithm
   Args:
     net: TensorNetwork object to contract.
     algorithm: `opt_einsum` method to use for calculating the contraction path.
+    edge_map: Optional dictionary mapping each edge incident on a copy node
+      to a representative edge of that copy node, as returned by
+      `find_copy_nodes`. When given, copy nodes are excluded from the path
+      search and their neighbors appear directly connected through the
+      representative edges.
 
   Returns:
-    The optimal contraction path as returned by `opt_einsum`.
+    The optimal contraction path as returned by `opt_einsum` and the list
+    of nodes the path indices refer to.
   """
-  sorted_nodes = sorted(net.nodes_set, key=lambda n: n.signature)
+  # An empty edge_map means no copy nodes: skip the per-node class checks
+  # and the per-edge representative lookups entirely.
+  if not edge_map:
+    sorted_nodes = sorted(net.nodes_set, key=lambda n: n.signature)
+    node_edges = [node.edges for node in sorted_nodes]
+  else:
+    sorted_nodes = sorted(
+        (node for node in net.nodes_set
+         if not isinstance(node, network_components.CopyNode)),
+        key=lambda n: n.signature)
+    representative = edge_map.get
+    node_edges = [[representative(edge, edge) for edge in node.edges]
+                  for node in sorted_nodes]
+  # With fewer than three nodes there is nothing to optimize.
+  if len(sorted_nodes) < 2:
+    return [], sorted_nodes
+  if len(sorted_nodes) == 2:
+    return [(0, 1)], sorted_nodes
+  algorithm_key = _algorithm_cache_key(algorithm)
+  if algorithm_key is not None and len(sorted_nodes) > 3:
+    # When Weisfeiler-Lehman refinement fully separates the nodes, order
+    # them canonically instead of by signature. The cache key below then
+    # depends only on the network structure, so structurally identical
+    # networks share one cache entry regardless of node creation order.
+    order = _canonical_node_order(node_edges)
+    if order is not None:
+      sorted_nodes = [sorted_nodes[i] for i in order]
+      node_edges = [node_edges[i] for i in order]
+  # Relabel edges with small integers in order of first occurrence. Integer
+  # hashing is far cheaper than Edge hashing inside the path search, and the
+  # labels double as a canonical form of the network structure for caching.
+  # Dimensions are read off each node's shape, fetched once per node;
+  # `edge.dimension` would redo the backend shape call for every edge.
+  labels = {}  # type: Dict[network_components.Edge, int]
+  sizes = []  # type: List[int]  # dimension per label, in label order
+  node_label_sets = []
+  # Bound-method hoists keep the per-edge cost of this bulk-build phase,
+  # which dominates over the path search on small networks, to a handful
+  # of bytecodes.
+  get_label = labels.get
+  append_size = sizes.append
+  append_label_set = node_label_sets.append
+  for node, edges in zip(sorted_nodes, node_edges):
+    shape = node.shape
+    label_set = []
+    for axis, edge in enumerate(edges):
+      label = get_label(edge)
+      if label is None:
+        label = len(labels)
+        labels[edge] = label
+        append_size(shape[axis])
+      label_set.append(label)
+    append_label_set(frozenset(label_set))
+  node_labels = tuple(node_label_sets)
+  # Frozensets are hashable, so opt_einsum's search can memoize subsets
+  # directly instead of promoting them first. The label pass above visited
+  # every edge once, so the output set and sizes fall out of `labels`
+  # without another walk over the network.
+  input_sets = list(node_labels)
+  output_set = frozenset(
+      label for edge, label in labels.items() if edge.is_dangling())
+  size_dict = dict(enumerate(sizes))
+
+  if (len(sorted_nodes) == 3 and algorithm_key is not None and
+      algorithm.keywords.get("memory_limit") is None):
+    # Enumerate the three possible pairings analytically; this matches
+    # what the known internal optimizers would search, without their
+    # setup overhead. Custom optimizers and memory-capped searches must
+    # still be consulted, so they skip this shortcut.
+    best_cost = None
+    best_pair = None
+    for i, j, k in ((0, 1, 2), (0, 2, 1), (1, 2, 0)):
+      union = input_sets[i] | input_sets[j]
+      intermediate = union & (input_sets[k] | output_set)
+      cost = (_sets_size(union, size_dict) +
+              _sets_size(intermediate | input_sets[k], size_dict))
+      if best_cost is None or cost < best_cost:
+        best_cost = cost
+        best_pair = (i, j)
+    return [best_pair, (0, 1)], sorted_nodes
+
+  if algorithm_key is None:
+    return algorithm(input_sets, output_set, size_dict), sorted_nodes
+
+  key = (algorithm_key, node_labels, output_set, tuple(sizes))
+  with _path_cache_lock:
+    path = _path_cache.get(key)
+    if path is not None:
+      _path_cache.move_to_end(key)
+  if path is not None:
+    return path, sorted_nodes
+
+  path = algorithm(input_sets, output_set, size_dict)
+  with _path_cache_lock:
+    _path_cache[key] = path
+    if len(_path_cache) > _PATH_CACHE_MAXSIZE:
+      _path_cache.popitem(last=False)
+  return path, sorted_nodes
+
+
+def get_path_async(net: network.TensorNetwork, algorithm: Algorithm,
+                   edge_map: Optional[Dict[network_components.Edge,
+                                           network_components.Edge]] = None,
+                   executor: Optional[
+                       concurrent.futures.Executor] = None
+                   ) -> "concurrent.futures.Future":
+  """Run `get_path` on a worker thread.
+
+  The path search is pure Python and only reads the network structure, so
+  it can overlap with backend work the caller wants to do before the
+  contraction starts (staging tensors on an accelerator, JIT warmup).
+  The network must not be mutated until the future resolves.
+
+  Args:
+    net: TensorNetwork object to contract.
+    algorithm: `opt_einsum` method to use for calculating the contraction
+      path.
+    edge_map: Optional copy-node edge mapping; see `get_path`.
+    executor: Optional executor to run the search on. By default a
+      single-use worker thread is spawned.
+
+  Returns:
+    A future resolving to the `(path, nodes)` pair of `get_path`.
+  """
+  if executor is None:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(get_path, net, algorithm, edge_map)
+    # The worker finishes the submitted search before shutting down.
+    executor.shutdown(wait=False)
+    return future
+  return executor.submit(get_path, net, algorithm, edge_map)
+
+
+def _subscripts() -> Any:
+  """Yields an unbounded stream of einsum subscript characters.
+
+  The first 52 symbols are the latin letters every backend accepts; beyond
+  that `opt_einsum.get_symbol` produces unicode characters which
+  `opt_einsum.contract` (used by the fused contraction) handles natively.
+  """
+  return (opt_einsum.get_symbol(i) for i in itertools.count())
+
+
+def _einsum(net: network.TensorNetwork, expression: str, *tensors: Any,
+            optimize: Optional[Any] = None) -> Any:
+  """Evaluate an einsum expression for `net`.
+
+  Normally this dispatches to the network's backend. Inside an
+  `opt_einsum.shared_intermediates` region (see the `cache` argument of the
+  path contractors) the contraction is routed through `opt_einsum.contract`
+  instead, so identical subcontractions are served from the sharing cache.
+  An explicit `optimize` strategy also routes through `opt_einsum.contract`,
+  which evaluates the expression along an optimized pairwise path.
+  """
+  if optimize is not None:
+    return opt_einsum.contract(expression, *tensors, optimize=optimize)
+  if opt_einsum.sharing.currently_sharing():
+    return opt_einsum.contract(expression, *tensors)
+  return net.backend.einsum(expression, *tensors)
+
+
+def find_copy_nodes(net: network.TensorNetwork
+                    ) -> Tuple[Dict[network_components.Edge,
+                                    network_components.Edge],
+                               Dict[network_components.CopyNode,
+                                    Set[network_components.BaseNode]]]:
+  """Find all copy nodes in a network.
+
+  Args:
+    net: TensorNetwork object to search.
+
+  Returns:
+    edge_map: Dictionary mapping each non-dangling edge of a copy node to a
+      representative edge of that copy node. Edges that share a
+      representative are contracted over the same index.
+    copy_neighbors: Dictionary mapping each copy node to the set of
+      non-copy nodes it connects to.
+  """
+  copy_node_cls = network_components.CopyNode
+  edge_map = {}
+  copy_neighbors = {}
+  for copy in net.nodes_set:
+    # Exact class checks skip isinstance's MRO walk in this hot scan.
+    if copy.__class__ is not copy_node_cls:
+      continue
+    neighbors = set()
+    copy_neighbors[copy] = neighbors
+    add_neighbor = neighbors.add
+    representative = None
+    for edge in copy.edges:
+      if edge.is_dangling() or edge.is_trace():
+        continue
+      node = edge.node1 if edge.node2 is copy else edge.node2
+      if node.__class__ is copy_node_cls:
+        continue
+      add_neighbor(node)
+      if representative is None:
+        representative = edge
+      edge_map[edge] = representative
+  # The scan above determined every neighbor's complete copy
+  # neighborhood; seed the per-node caches with the inverse mapping so
+  # later find_copy_neighbors queries are dict probes instead of edge
+  # walks.
+  inverse = {}
+  for copy, neighbors in copy_neighbors.items():
+    for node in neighbors:
+      if node in inverse:
+        inverse[node].add(copy)
+      else:
+        inverse[node] = {copy}
+  for node, copies in inverse.items():
+    node._copy_neighbors = copies
+  return edge_map, copy_neighbors
+
+
+def update_copy_map(net: network.TensorNetwork,
+                    copy_neighbors: Dict[network_components.CopyNode,
+                                         Set[network_components.BaseNode]],
+                    removed_nodes: Tuple[network_components.BaseNode, ...],
+                    new_node: network_components.BaseNode) -> None:
+  """Patch a `copy_neighbors` map in place after a pairwise contraction.
+
+  Rescanning the whole network with `find_copy_nodes` after every
+  contraction step is O(n) per step. This only touches the copies whose
+  neighborhood actually changed: consumed copy nodes are dropped, the new
+  node replaces the removed ones, and residual copies created by
+  `isolate_copy_node` are discovered from the new node's edges.
+
+  Args:
+    net: TensorNetwork object.
+    copy_neighbors: The map returned by `find_copy_nodes`, updated in
+      place.
+    removed_nodes: The nodes consumed by the contraction.
+    new_node: The node created by the contraction.
+  """
+  # `removed_nodes` is a pair; probing it directly beats building a
+  # throwaway set on every contraction step.
+  for copy in list(copy_neighbors):
+    if copy not in net.nodes_set:
+      del copy_neighbors[copy]
+      continue
+    neighbors = copy_neighbors[copy]
+    if any(node in neighbors for node in removed_nodes):
+      neighbors.difference_update(removed_nodes)
+      neighbors.add(new_node)
+  for copy in find_copy_neighbors(net, new_node):
+    if copy not in copy_neighbors:
+      neighbors = set()
+      for edge in copy.edges:
+        if edge.is_dangling() or edge.is_trace():
+          continue
+        node = edge.node1 if edge.node2 is copy else edge.node2
+        if not isinstance(node, network_components.CopyNode):
+          neighbors.add(node)
+      copy_neighbors[copy] = neighbors
+
+
+def find_copy_neighbors(net: network.TensorNetwork,
+                        node: network_components.BaseNode
+                        ) -> Set[network_components.CopyNode]:
+  """Find all copy nodes connected to a node.
+
+  The result is cached on the node and invalidated whenever its edges
+  change, so repeated lookups from the contraction loop are O(1).
+  """
+  if node._copy_neighbors is not None:
+    return node._copy_neighbors
+  copies = set()
+  for edge in node.edges:
+    if edge.is_dangling():
+      continue
+    neighbor = edge.node1 if edge.node2 is node else edge.node2
+    if isinstance(neighbor, network_components.CopyNode):
+      copies.add(neighbor)
+  node._copy_neighbors = copies
+  return copies
+
+
+def disconnect_copy_edge(net: network.TensorNetwork,
+                         edge: network_components.Edge,
+                         node: network_components.BaseNode
+                         ) -> Tuple[network_components.Edge,
+                                    network_components.Edge]:
+  """Disconnect an edge between a node and a copy node.
+
+  Args:
+    net: TensorNetwork object.
+    edge: The edge to disconnect.
+    node: The non-copy node the edge is incident on.
+
+  Returns:
+    The two new dangling edges, the one attached to `node` first.
+  """
+  edge_node, edge_copy = net.disconnect(edge)
+  if edge_node.node1 is not node:
+    edge_node, edge_copy = edge_copy, edge_node
+  return edge_node, edge_copy
+
+
+def isolate_copy_node(net: network.TensorNetwork,
+                      copy: network_components.CopyNode,
+                      node1: network_components.BaseNode,
+                      node2: network_components.BaseNode
+                      ) -> network_components.CopyNode:
+  """Isolate the part of a copy node shared by two nodes.
+
+  A new copy node is split off carrying the edges to `node1` and `node2`,
+  while the given copy node is reduced in place to a residual holding all
+  remaining edges, joined to the new copy by a new edge. This leaves the
+  new copy node ready to be consumed by a pairwise contraction of `node1`
+  and `node2` without affecting the rest of the network. Splitting a copy
+  tensor this way is exact since contracting two copy tensors over a
+  single index yields the copy tensor of the combined rank.
+
+  Args:
+    net: TensorNetwork object.
+    copy: The copy node to isolate.
+    node1: The first node.
+    node2: The second node.
+
+  Returns:
+    The new copy node connected to `node1`, `node2` and the reduced
+    residual copy node.
+  """
+  # Partition the copy's edges in a single pass. Lists suffice here since
+  # the insertion order is also the axis assignment order below.
+  edges1 = []
+  edges2 = []
+  append1 = edges1.append
+  append2 = edges2.append
+  for edge in copy.edges:
+    n1, n2 = edge.node1, edge.node2
+    if n1 is node1 or n2 is node1:
+      append1(edge)
+    elif n1 is node2 or n2 is node2:
+      append2(edge)
+
+  new_copy = net.add_copy_node(
+      rank=len(edges1) + len(edges2) + 1, dimension=copy.dimension,
+      dtype=copy.dtype)
+  copy_edges = []
+  axis = 0
+  disconnect = net.disconnect
+  for node, edges in [(node1, edges1), (node2, edges2)]:
+    for edge in edges:
+      # `disconnect_copy_edge`, inlined to skip a function frame per edge.
+      node_edge, copy_edge = disconnect(edge)
+      if node_edge.node1 is not node:
+        node_edge, copy_edge = copy_edge, node_edge
+      net.connect(node_edge, new_copy[axis])
+      copy_edges.append(copy_edge)
+      axis += 1
+
+  # Reduce the original copy to the residual in place: drop all but one
+  # of the disconnected axes in a single batch and bridge the remaining
+  # one to the new copy.
+  bridge_edge = copy_edges.pop()
+  copy.remove_edges(copy_edges)
+  net.connect(bridge_edge, new_copy[-1])
+  return new_copy
+
+
+def contract_between_with_copies(net: network.TensorNetwork,
+                                 node1: network_components.BaseNode,
+                                 node2: network_components.BaseNode,
+                                 shared_copies: Set[
+                                     network_components.CopyNode],
+                                 name: Optional[str] = None
+                                 ) -> network_components.BaseNode:
+  """Contract two nodes and all copy nodes they share in a single einsum.
+
+  The copy tensors are never materialized: every copy node in
+  `shared_copies` contributes one repeated subscript to the einsum
+  expression instead of an operand. Copy nodes that also connect to the
+  rest of the network are reduced in place to a residual copy node which
+  is attached to the new node.
+
+  Args:
+    net: TensorNetwork object.
+    node1: The first node.
+    node2: The second node.
+    shared_copies: The copy nodes shared by `node1` and `node2`.
+    name: Optional name to give the new node.
+
+  Returns:
+    The new node created by the contraction.
+  """
+  subscripts = _subscripts()
+
+  # Assign one subscript per copy node, shared by all of its edges. A copy
+  # that also serves the rest of the network is reduced in place: its
+  # shared edges are detached (the node-side stubs carry the subscript
+  # into the einsum) and one copy-side stub is kept as a bridge to the new
+  # node, which keeps the subscript alive in the output. This avoids
+  # creating and immediately consuming an intermediate copy node.
+  consumed_copies = []
+  copy_edge_char = {}
+  bridges = []
+  for copy in shared_copies:
+    shared_edges = []
+    has_outside_edges = False
+    for edge in copy.edges:
+      n1, n2 = edge.node1, edge.node2
+      if n1 is node1 or n1 is node2:
+        shared_edges.append((edge, n1))
+      elif n2 is node1 or n2 is node2:
+        shared_edges.append((edge, n2))
+      else:
+        has_outside_edges = True
+    char = next(subscripts)
+    if has_outside_edges:
+      stubs = []
+      for edge, node in shared_edges:
+        # `disconnect_copy_edge`, inlined to skip a function frame per edge.
+        node_edge, copy_edge = net.disconnect(edge)
+        if node_edge.node1 is not node:
+          node_edge, copy_edge = copy_edge, node_edge
+        copy_edge_char[node_edge] = char
+        stubs.append(copy_edge)
+      bridges.append((char, stubs.pop(), copy))
+      if stubs:
+        copy.remove_edges(stubs)
+    else:
+      for edge in copy.edges:
+        copy_edge_char[edge] = char
+      consumed_copies.append(copy)
+
+  edge_char = {}
+  outputs = []  # (char, edge, node, old_axis) per free edge
+  input_terms = []
+  for node in [node1, node2]:
+    term = []
+    # Resolve the copy subscripts with one dict lookup per edge up front;
+    # the loop body then only branches on `is None`.
+    copy_chars = [copy_edge_char.get(edge) for edge in node.edges]
+    for edge, copy_char in zip(node.edges, copy_chars):
+      if copy_char is not None:
+        term.append(copy_char)
+      elif edge.is_trace() or (not edge.is_dangling() and
+                               (edge.node1 is node1 or edge.node1 is node2) and
+                               (edge.node2 is node1 or edge.node2 is node2)):
+        char = edge_char.get(edge)
+        if char is None:
+          char = next(subscripts)
+          edge_char[edge] = char
+        term.append(char)
+      else:
+        char = next(subscripts)
+        term.append(char)
+        outputs.append((char, edge, node,
+                        edge.axis1 if edge.node1 is node else edge.axis2))
+    input_terms.append("".join(term))
+
+  # When no subscript repeats within an operand and no bridge keeps a copy
+  # subscript alive in the output, the expression is a plain pairwise
+  # contraction (a fully shared rank-2 copy is just an identity matrix).
+  # Route that case through `tensordot`, which backends dispatch to BLAS,
+  # instead of a generic einsum loop. Inside a sharing region keep the
+  # einsum route so the cache sees the contraction.
+  term1, term2 = input_terms
+  if (not bridges and len(set(term1)) == len(term1) and
+      len(set(term2)) == len(term2) and
+      not opt_einsum.sharing.currently_sharing()):
+    shared_chars = set(term1) & set(term2)
+    axes1 = [axis for axis, char in enumerate(term1) if char in shared_chars]
+    axes2 = [term2.index(term1[axis]) for axis in axes1]
+    # The uncontracted axes keep their per-operand order, so the result
+    # already matches the output subscripts and needs no transpose.
+    new_tensor = net.backend.tensordot(node1.tensor, node2.tensor,
+                                       axes=(axes1, axes2))
+  else:
+    einsum_expr = "{},{}->{}".format(
+        term1, term2,
+        "".join(char for char, _, _, _ in outputs) +
+        "".join(char for char, _, _ in bridges))
+    new_tensor = _einsum(net, einsum_expr, node1.tensor, node2.tensor)
+  new_node = net.add_node(new_tensor, name)
+
+  for axis, (_, edge, node, old_axis) in enumerate(outputs):
+    edge.update_axis(old_axis, node, axis, new_node)
+    new_node.add_edge(edge, axis)
+  for axis, (_, stub, _) in enumerate(bridges, start=len(outputs)):
+    # `add_node` left a dangling edge on this axis; join it to the stub
+    # kept on the residual copy.
+    net.connect(stub, new_node[axis])
+
+  for old_node in [node1, node2] + consumed_copies:
+    net.nodes_set.remove(old_node)
+    old_node.disable()
+  return new_node
+
+
+def contract_between_copy(net: network.TensorNetwork,
+                          copy: network_components.CopyNode,
+                          name: Optional[str] = None,
+                          optimize: Optional[Any] = None
+                          ) -> network_components.BaseNode:
+  """Contract a copy node with all of its neighboring nodes.
+
+  The contraction is performed in a single einsum call in which the copy
+  node contributes a repeated subscript rather than a materialized
+  tensor. Edges shared directly between the neighbors are contracted in
+  the same call.
+
+  Args:
+    net: TensorNetwork object.
+    copy: The copy node to contract.
+    name: Optional name to give the new node.
+    optimize: Optional `opt_einsum` path strategy (e.g. `'greedy'` or a
+      precomputed path). When given, the einsum is evaluated pairwise
+      along an optimized path instead of in one backend call; for copy
+      nodes with several high-dimensional neighbors this is
+      asymptotically cheaper.
+
+  Returns:
+    The new node created by the contraction.
+
+  Raises:
+    ValueError: If the copy node has dangling or trace edges.
+  """
+  partners = []
+  for edge in copy.edges:
+    if edge.is_dangling():
+      raise ValueError(
+          "Cannot contract copy node '{}' with dangling edges".format(copy))
+    if edge.is_trace():
+      raise ValueError(
+          "Cannot contract copy node '{}' with trace edges".format(copy))
+    node = edge.node1 if edge.node2 is copy else edge.node2
+    if node not in partners:
+      partners.append(node)
+
+  subscripts = _subscripts()
+  copy_char = next(subscripts)
+  partner_set = set(partners)
+  edge_char = {}
+  output_chars = []
+  output_edges = []
+  input_terms = []
+  for node in partners:
+    term = []
+    for edge in node.edges:
+      n1, n2 = edge.node1, edge.node2
+      if n1 is copy or n2 is copy:
+        term.append(copy_char)
+      elif edge.is_trace() or (not edge.is_dangling() and
+                               n1 in partner_set and n2 in partner_set):
+        char = edge_char.get(edge)
+        if char is None:
+          char = next(subscripts)
+          edge_char[edge] = char
+        term.append(char)
+      else:
+        char = next(subscripts)
+        term.append(char)
+        output_chars.append(char)
+        old_axis = edge.axis1 if edge.node1 is node else edge.axis2
+        output_edges.append((edge, node, old_axis))
+    input_terms.append("".join(term))
+
+  new_tensor = None
+  if (optimize is None and len(partners) == 2 and
+      not opt_einsum.sharing.currently_sharing()):
+    # A copy node with one edge to each of two partners is an identity
+    # matrix, so when no subscript repeats within an operand the
+    # expression is a plain pairwise contraction; route it through
+    # `tensordot`, which backends dispatch to BLAS. Repeated subscripts
+    # (genuine diagonals) keep the einsum route.
+    term1, term2 = input_terms
+    if len(set(term1)) == len(term1) and len(set(term2)) == len(term2):
+      shared_chars = set(term1) & set(term2)
+      axes1 = [axis for axis, char in enumerate(term1) if char in shared_chars]
+      axes2 = [term2.index(term1[axis]) for axis in axes1]
+      new_tensor = net.backend.tensordot(partners[0].tensor,
+                                         partners[1].tensor,
+                                         axes=(axes1, axes2))
+  if new_tensor is None:
+    einsum_expr = "{}->{}".format(",".join(input_terms), "".join(output_chars))
+    new_tensor = _einsum(
+        net, einsum_expr, *[node.tensor for node in partners],
+        optimize=optimize)
+  new_node = net.add_node(new_tensor, name)
+
+  for axis, (edge, node, old_axis) in enumerate(output_edges):
+    edge.update_axis(old_axis, node, axis, new_node)
+    new_node.add_edge(edge, axis)
+
+  for old_node in partners + [copy]:
+    net.nodes_set.remove(old_node)
+    old_node.disable()
+  return new_node
+
+
+def contract_network(net: network.TensorNetwork,
+                     path: List[Tuple[int, int]],
+                     nodes: List[network_components.BaseNode],
+                     edge_map: Dict[network_components.Edge,
+                                    network_components.Edge],
+                     copy_nodes: List[network_components.CopyNode],
+                     name: Optional[str] = None
+                     ) -> network_components.BaseNode:
+  """Contract a whole network in a single `opt_einsum` call.
+
+  Every node contributes one operand to a fused einsum expression which
+  is evaluated along the precomputed `path`, instead of dispatching one
+  backend call per contraction step. Copy nodes contribute a repeated
+  subscript rather than an operand and must be fully consumed by the
+  contraction (no dangling, trace or copy-copy edges).
+
+  Args:
+    net: TensorNetwork object.
+    path: Contraction path over `nodes`, as returned by `get_path`.
+    nodes: The non-copy nodes of the network, in the order used to
+      compute `path`.
+    edge_map: Mapping of copy-node edges to representative edges, as
+      returned by `find_copy_nodes`.
+    copy_nodes: The copy nodes consumed by the contraction.
+    name: Optional name to give the new node.
+
+  Returns:
+    The new node holding the result of the full contraction.
+  """
+  subscripts = _subscripts()
+  label_char = {}
+  output_chars = []
+  output_edges = []
+  input_terms = []
+  for node in nodes:
+    term = []
+    for edge in node.edges:
+      label = edge_map.get(edge, edge)
+      char = label_char.get(label)
+      if char is None:
+        char = next(subscripts)
+        label_char[label] = char
+        if edge.is_dangling():
+          output_chars.append(char)
+          output_edges.append((edge, node, edge.axis1))
+      term.append(char)
+    input_terms.append("".join(term))
+
+  einsum_expr = "{}->{}".format(",".join(input_terms), "".join(output_chars))
+  new_tensor = opt_einsum.contract(
+      einsum_expr, *[node.tensor for node in nodes], optimize=path)
+  new_node = net.add_node(new_tensor, name)
 
-  input_sets = [set(node.edges) for node in sorted_nodes]
-  output_set = net.get_all_edges() - net.get_all_nondangling()
-  size_dict = {edge: edge.dimension for edge in net.get_all_edges()}
+  for axis, (edge, node, old_axis) in enumerate(output_edges):
+    edge.update_axis(old_axis, node, axis, new_node)
+    new_node.add_edge(edge, axis)
 
-  return algorithm(input_sets, output_set, size_dict), sorted_nodes
\ No newline at end of file
+  for old_node in nodes + list(copy_nodes):
+    net.nodes_set.remove(old_node)
+    old_node.disable()
+  return new_node
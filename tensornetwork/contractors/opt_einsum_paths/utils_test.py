@@ -0,0 +1,245 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+
+import numpy as np
+import pytest
+import tensornetwork
+from tensornetwork.contractors.opt_einsum_paths import utils
+
+# Shared across tests and backends; marked read-only so accidental
+# mutation through an aliasing node fails loudly instead of corrupting
+# other tests.
+ONES_22 = np.ones([2, 2])
+ONES_222 = np.ones([2, 2, 2])
+ONES_33 = np.ones([3, 3])
+ONES_333 = np.ones([3, 3, 3])
+COPY_CONTRACTION_EXPECTED = np.full(3, 9.0)
+for _array in (ONES_22, ONES_222, ONES_33, ONES_333,
+               COPY_CONTRACTION_EXPECTED):
+  _array.setflags(write=False)
+
+
+@pytest.fixture(name="copy_net_small")
+def copy_net_small_fixture():
+  """A single node joined to a rank-2 copy node.
+
+  Topology only, so it always uses the numpy backend; backend
+  parametrization is reserved for the tests that do tensor math.
+  """
+  net = tensornetwork.TensorNetwork(backend="numpy")
+  a = net.add_node(ONES_22)
+  cn = net.add_copy_node(rank=2, dimension=2)
+  edge = a[0] ^ cn[0]
+  return net, a, cn, edge
+
+
+@pytest.fixture(name="copy_net_triple")
+def copy_net_triple_fixture():
+  """Three nodes fanned into one rank-3 copy node.
+
+  Topology only, so it always uses the numpy backend; backend
+  parametrization is reserved for the tests that do tensor math.
+  """
+  net = tensornetwork.TensorNetwork(backend="numpy")
+  a = net.add_node(ONES_22)
+  b = net.add_node(ONES_22)
+  c = net.add_node(ONES_22)
+  cn = net.add_copy_node(rank=3, dimension=2)
+  # pylint: disable=pointless-statement
+  a[0] ^ cn[0]
+  b[0] ^ cn[1]
+  c[0] ^ cn[2]
+  return net, (a, b, c), cn
+
+
+def _build_chain_network():
+  net = tensornetwork.TensorNetwork(backend="numpy")
+  nodes = [net.add_node(ONES_22) for _ in range(4)]
+  for n1, n2 in zip(nodes, nodes[1:]):
+    # pylint: disable=pointless-statement
+    n1[1] ^ n2[0]
+  return net
+
+
+def test_get_path_cached():
+  utils.clear_path_cache()
+  algorithm = functools.partial(utils.optimal_path, memory_limit=None)
+  path1, _ = utils.get_path(_build_chain_network(), algorithm)
+  assert len(utils._path_cache) == 1
+  # A topologically identical network with identical dimensions hits the
+  # cache and gets the memoized path back.
+  path2, _ = utils.get_path(_build_chain_network(), algorithm)
+  assert path2 is path1
+  assert len(utils._path_cache) == 1
+  utils.clear_path_cache()
+  assert not utils._path_cache
+
+
+def test_get_path_cached_across_node_orders():
+  utils.clear_path_cache()
+  algorithm = functools.partial(utils.optimal_path, memory_limit=None)
+
+  def build_chain(reverse):
+    net = tensornetwork.TensorNetwork(backend="numpy")
+    shapes = [(2, 3), (3, 4), (4, 5), (5, 6)]
+    if reverse:
+      shapes = shapes[::-1]
+    nodes = [net.add_node(np.ones(shape)) for shape in shapes]
+    if reverse:
+      nodes = nodes[::-1]
+    for n1, n2 in zip(nodes, nodes[1:]):
+      # pylint: disable=pointless-statement
+      n1[1] ^ n2[0]
+    return net
+
+  path1, nodes1 = utils.get_path(build_chain(False), algorithm)
+  # The chain's nodes are all distinguishable, so the canonical ordering
+  # kicks in and the creation order does not matter for the cache key.
+  path2, nodes2 = utils.get_path(build_chain(True), algorithm)
+  assert path2 is path1
+  assert len(utils._path_cache) == 1
+  assert [n.shape for n in nodes1] == [n.shape for n in nodes2]
+  utils.clear_path_cache()
+
+
+def test_get_path_async():
+  utils.clear_path_cache()
+  algorithm = functools.partial(utils.optimal_path, memory_limit=None)
+  path, nodes = utils.get_path(_build_chain_network(), algorithm)
+  future = utils.get_path_async(_build_chain_network(), algorithm)
+  async_path, async_nodes = future.result()
+  assert async_path == path
+  assert [n.shape for n in async_nodes] == [n.shape for n in nodes]
+  utils.clear_path_cache()
+
+
+def test_find_copy_nodes():
+  # Pure topology; one numpy run covers every backend.
+  net = tensornetwork.TensorNetwork(backend="numpy")
+  a = net.add_node(ONES_222)
+  b = net.add_node(ONES_22)
+  c = net.add_node(ONES_22)
+  cn1 = net.add_copy_node(rank=3, dimension=2)
+  cn2 = net.add_copy_node(rank=3, dimension=2)
+  # pylint: disable=pointless-statement
+  a[0] ^ cn1[0]
+  a[1] ^ cn1[1]
+  a[2] ^ cn2[0]
+  b[0] ^ cn2[1]
+  c[0] ^ cn2[2]
+  edge_map, copy_neighbors = utils.find_copy_nodes(net)
+  assert copy_neighbors == {cn1: {a}, cn2: {a, b, c}}
+  # All non-dangling edges of a copy node share one representative edge.
+  for cn in [cn1, cn2]:
+    representative = None
+    for edge in cn.edges:
+      if edge.is_dangling():
+        continue
+      if representative is None:
+        representative = edge_map[edge]
+      else:
+        assert edge_map[edge] is representative
+    assert representative is not None
+
+
+def test_disconnect_copy_edge(copy_net_small):
+  net, a, cn, edge = copy_net_small
+  node_edge, copy_edge = utils.disconnect_copy_edge(net, edge, a)
+  assert node_edge.is_dangling()
+  assert node_edge.node1 is a
+  assert copy_edge.is_dangling()
+  assert copy_edge.node1 is cn
+
+
+def test_isolate_copy_node(copy_net_triple):
+  net, (a, b, c), cn = copy_net_triple
+  new_cn = utils.isolate_copy_node(net, cn, a, b)
+  assert new_cn.get_rank() == 3
+  neighbors = set(
+      edge.node1 if edge.node2 is new_cn else edge.node2
+      for edge in new_cn.edges)
+  assert a in neighbors
+  assert b in neighbors
+  # The original copy is reduced in place to the residual.
+  residual = (neighbors - {a, b}).pop()
+  assert residual is cn
+  assert residual.get_rank() == 2
+  assert c in set(
+      edge.node1 if edge.node2 is residual else edge.node2
+      for edge in residual.edges)
+
+
+def test_contract_between_with_copies(backend):
+  net = tensornetwork.TensorNetwork(backend=backend)
+  x = net.add_node(ONES_22)
+  y = net.add_node(ONES_222)
+  cn = net.add_copy_node(rank=2, dimension=2)
+  # pylint: disable=pointless-statement
+  x[0] ^ y[1]
+  x[1] ^ cn[0]
+  y[0] ^ cn[1]
+  shared_copies = (utils.find_copy_neighbors(net, x) &
+                   utils.find_copy_neighbors(net, y))
+  node = utils.contract_between_with_copies(net, x, y, shared_copies)
+  np.testing.assert_allclose(node.tensor, 4 * np.ones(2))
+
+
+def test_contract_between_with_copies_output_order(backend):
+  net = tensornetwork.TensorNetwork(backend=backend)
+  x = net.add_node(np.ones([2, 5, 3]))
+  y = net.add_node(np.ones([3, 5, 4]))
+  cn = net.add_copy_node(rank=2, dimension=3)
+  # pylint: disable=pointless-statement
+  x[1] ^ y[1]
+  x[2] ^ cn[0]
+  y[0] ^ cn[1]
+  x_free = x[0]
+  y_free = y[2]
+  node = utils.contract_between_with_copies(net, x, y, {cn})
+  # The free edges of the first node come before those of the second, both
+  # in input axis order, so the backend needs no final transpose.
+  assert node.edges == [x_free, y_free]
+  assert node.shape == (2, 4)
+
+
+def test_contract_between_copy(backend):
+  net = tensornetwork.TensorNetwork(backend=backend)
+  x = net.add_node(ONES_33)
+  y = net.add_node(ONES_333)
+  c = net.add_copy_node(rank=2, dimension=3)
+  # pylint: disable=pointless-statement
+  x[0] ^ y[1]
+  x[1] ^ c[0]
+  y[0] ^ c[1]
+  # Contract along an optimized pairwise path rather than one ternary
+  # einsum call.
+  node = utils.contract_between_copy(net, c, optimize="greedy")
+  np.testing.assert_allclose(node.tensor, COPY_CONTRACTION_EXPECTED)
+
+
+def test_contract_between_copy_default(backend):
+  net = tensornetwork.TensorNetwork(backend=backend)
+  x = net.add_node(ONES_33)
+  y = net.add_node(ONES_333)
+  c = net.add_copy_node(rank=2, dimension=3)
+  # pylint: disable=pointless-statement
+  x[0] ^ y[1]
+  x[1] ^ c[0]
+  y[0] ^ c[1]
+  # Without an optimize strategy the two-partner case dispatches to the
+  # backend's tensordot.
+  node = utils.contract_between_copy(net, c)
+  np.testing.assert_allclose(node.tensor, COPY_CONTRACTION_EXPECTED)
@@ -86,6 +86,9 @@ class BaseNode(ABC):
       self._axis_names = None
 
     self._signature = -1
+    # Cached set of neighboring copy nodes, maintained by the contractors.
+    # Reset to None whenever the node's edges change.
+    self._copy_neighbors = None
 
     super().__init__()
 
@@ -137,6 +140,7 @@ class BaseNode(ABC):
           "Node '{}' already has a non-dangling edge for axis {}".format(
               self, axis))
     self.edges[axis_num] = edge
+    self._copy_neighbors = None
 
   @abstractmethod
   def get_tensor(self):
@@ -349,6 +353,7 @@ class BaseNode(ABC):
                        'Assigning edges is no longer possible'.format(
                            self.name))
     self._edges = edges
+    self._copy_neighbors = None
 
   @property
   def axis_names(self):
@@ -562,6 +567,47 @@ class CopyNode(BaseNode):
     copy_tensor[(i,) * rank] = 1
     return copy_tensor
 
+  def remove_edges(self, edges: List["Edge"]) -> None:
+    """Remove a batch of dangling edges, reducing the node's rank.
+
+    The remaining edges are reassigned to consecutive axes in their
+    current order and the edge list is rewritten once, so removing k
+    edges costs O(rank) rather than k separate O(rank) updates.
+
+    Args:
+      edges: The edges to remove. All of them must be dangling.
+
+    Raises:
+      ValueError: If an edge to remove is not dangling.
+    """
+    removed = set(edges)
+    for edge in removed:
+      if not edge.is_dangling():
+        raise ValueError(
+            "Cannot remove non-dangling edge '{}' from '{}'".format(
+                edge, self))
+    remaining = []
+    updates = []
+    for old_axis, edge in enumerate(self.edges):
+      if edge in removed:
+        continue
+      updates.append((edge, old_axis, len(remaining)))
+      remaining.append(edge)
+    remaining_names = None
+    if self.axis_names is not None:
+      remaining_names = [
+          name for name, edge in zip(self.axis_names, self.edges)
+          if edge not in removed
+      ]
+    self.rank = len(remaining)
+    self._tensor = None
+    self.edges = remaining
+    if remaining_names is not None:
+      self.axis_names = remaining_names
+    for edge, old_axis, new_axis in updates:
+      if old_axis != new_axis:
+        edge.update_axis(old_axis, self, new_axis, self)
+
   def _is_my_trace(self, edge: "Edge") -> bool:
     return edge.node1 is self and edge.node2 is self
 
@@ -734,14 +780,21 @@ class Edge:
     if self.axis1 == old_axis and self.node1 is old_node:
       self.axis1 = new_axis
       self.node1 = new_node
+      other_node = self._node2() if not self._is_dangling else None
     elif self.axis2 == old_axis and self.node2 is old_node:
       self.axis2 = new_axis
       self.node2 = new_node
+      other_node = self._node1()
     else:
       raise ValueError("Edge '{}' did not contain node '{}' on axis {}. "
                        "node1: '{}', axis1: {}, node2: '{}', axis2: {}".format(
                            self, old_node, old_axis, self.node1, self.axis1,
                            self.node2, self.axis2))
+    # Rewiring the edge changes the neighborhood of every node involved.
+    old_node._copy_neighbors = None
+    new_node._copy_neighbors = None
+    if other_node is not None:
+      other_node._copy_neighbors = None
 
   @property
   def node1(self) -> BaseNode: